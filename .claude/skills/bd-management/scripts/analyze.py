@@ -4,11 +4,13 @@ Beads Workflow Analysis Script
 Analyzes task dependencies and identifies optimization opportunities
 """
 
-import json
 import sys
 import os
+from collections import defaultdict, deque
 from pathlib import Path
-from typing import Dict, List, Set, Optional
+from typing import Dict, List, Set, Optional, Tuple
+
+from beads_io import file_fingerprint, load_cached, read_json, write_json
 
 def load_beads_data():
     """Load Beads data from .beads directory"""
@@ -22,38 +24,46 @@ def load_beads_data():
         print("❌ No Beads issues found.")
         sys.exit(1)
 
-    with open(issues_file, 'r') as f:
-        return json.load(f)
+    return intern_issue_ids(read_json(issues_file))
+
+def intern_issue_ids(issues: List[Dict]) -> List[Dict]:
+    """Intern issue ids and store each blocks list as a deduplicated tuple of interned ids"""
+    for issue in issues:
+        issue_id = issue.get('id')
+        if isinstance(issue_id, str):
+            issue['id'] = sys.intern(issue_id)
+        deps = issue.get('deps')
+        if deps and 'blocks' in deps:
+            targets = deps['blocks'] or ()
+            deps['blocks'] = tuple(dict.fromkeys(
+                sys.intern(target) if isinstance(target, str) else target for target in targets
+            ))
+    return issues
 
 def analyze_dependencies(issues: List[Dict]) -> Dict:
-    """Analyze task dependencies and identify blocking issues"""
+    """Analyze task dependencies and identify blocking issues (reported by id)"""
     blocking_issues = []
     ready_issues = []
     dependency_map = {}
+    blocked_by = defaultdict(set)
 
-    # Build dependency map
+    # Build dependency map and its inverse (blocked id -> blocker ids) in one pass
     for issue in issues:
         issue_id = issue.get('id')
         depends_on = issue.get('deps', {}).get('blocks', [])
         dependency_map[issue_id] = depends_on
+        for target in depends_on:
+            if target != issue_id:
+                blocked_by[target].add(issue_id)
 
     # Analyze each issue
     for issue in issues:
-        issue_id = issue.get('id')
         status = issue.get('status', 'open')
 
         if status == 'blocked':
-            blocking_issues.append(issue)
-        elif status == 'open':
-            # Check if this issue is blocked by others
-            is_blocked = False
-            for other_issue in issues:
-                if other_issue.get('id') != issue_id and issue_id in dependency_map.get(other_issue.get('id'), []):
-                    is_blocked = True
-                    break
-
-            if not is_blocked:
-                ready_issues.append(issue)
+            blocking_issues.append(issue.get('id'))
+        elif status == 'open' and not blocked_by.get(issue.get('id')):
+            ready_issues.append(issue.get('id'))
 
     return {
         'blocking_issues': blocking_issues,
@@ -64,88 +74,153 @@ def analyze_dependencies(issues: List[Dict]) -> Dict:
         'blocked_count': len(blocking_issues)
     }
 
-def find_parallel_groups(issues: List[Dict], dependency_map: Dict) -> List[List[Dict]]:
-    """Find groups of issues that can be executed in parallel"""
+def _topological_levels(issues: List[Dict], dependency_map: Dict) -> Tuple[Dict, Dict, List[List[str]]]:
+    """Split issue ids into Kahn wavefronts; raises ValueError on a dependency cycle"""
+    by_id = {issue.get('id'): issue for issue in issues}
+    succs = defaultdict(list)
+    indeg = dict.fromkeys(by_id, 0)
+
+    # Count incoming edges once; unknown ids and self-edges are ignored
+    for issue_id in by_id:
+        for target in dependency_map.get(issue_id, []):
+            if target in by_id and target != issue_id:
+                succs[issue_id].append(target)
+                indeg[target] += 1
+
+    levels = []
+    frontier = deque(issue_id for issue_id, degree in indeg.items() if degree == 0)
+
+    # Each BFS wavefront of zero in-degree issues forms one level
+    while frontier:
+        levels.append(list(frontier))
+        next_frontier = deque()
+        while frontier:
+            issue_id = frontier.popleft()
+            for target in succs[issue_id]:
+                indeg[target] -= 1
+                if indeg[target] == 0:
+                    next_frontier.append(target)
+        frontier = next_frontier
+
+    # Issues never reaching zero in-degree sit on (or behind) a dependency cycle
+    if sum(len(level) for level in levels) != len(by_id):
+        cyclic = [issue_id for issue_id, degree in indeg.items() if degree > 0]
+        raise ValueError(f"Dependency cycle among: {cyclic[:10]}")
+
+    return by_id, succs, levels
+
+def _criticality_from_levels(succs: Dict, levels: List[List[str]]) -> Dict[str, int]:
+    """Backflow DP: cp(n) = 1 + max(cp(child)), evaluated in reverse topological order"""
+    criticality = {}
+    for level in reversed(levels):
+        for issue_id in level:
+            criticality[issue_id] = 1 + max((criticality[s] for s in succs[issue_id]), default=0)
+    return criticality
+
+def compute_criticality(issues: List[Dict], dependency_map: Dict,
+                        topology: Optional[Tuple[Dict, Dict, List[List[str]]]] = None) -> Dict[str, int]:
+    """Length of the longest dependency chain starting at each issue"""
+    _, succs, levels = topology or _topological_levels(issues, dependency_map)
+    return _criticality_from_levels(succs, levels)
+
+def find_parallel_groups(issues: List[Dict], dependency_map: Dict,
+                         criticality: Optional[Dict[str, int]] = None,
+                         topology: Optional[Tuple[Dict, Dict, List[List[str]]]] = None) -> List[List[Dict]]:
+    """Find groups of issues that can be executed in parallel, critical path first"""
+    by_id, succs, levels = topology or _topological_levels(issues, dependency_map)
+    if criticality is None:
+        criticality = _criticality_from_levels(succs, levels)
+
     parallel_groups = []
-    remaining_issues = issues.copy()
-
-    while remaining_issues:
-        current_group = []
-        issues_to_remove = []
-
-        for issue in remaining_issues:
-            issue_id = issue.get('id')
-            # Check if this issue depends on any issue in current group
-            can_add = True
-            for other_issue in current_group:
-                other_id = other_issue.get('id')
-                if issue_id in dependency_map.get(other_id, []):
-                    can_add = False
-                    break
-
-            if can_add:
-                current_group.append(issue)
-                issues_to_remove.append(issue)
-
-        if current_group:
-            parallel_groups.append(current_group)
-            for issue in issues_to_remove:
-                remaining_issues.remove(issue)
-        else:
-            # No more parallel groups possible
-            break
+    for level in levels:
+        level.sort(key=lambda issue_id: -criticality.get(issue_id, 1))
+        parallel_groups.append([by_id[issue_id] for issue_id in level])
 
     return parallel_groups
 
-def main():
-    """Main analysis function"""
+def summary_titles(analysis: Dict, by_id: Dict[str, Dict]) -> Dict[str, str]:
+    """Titles of just the issues print_analysis shows, so a cached report needs no issues.json"""
+    shown = analysis['blocking_issues'][:3] + analysis['ready_issues'][:3]
+    for group in analysis.get('parallel_groups', [])[:2]:
+        shown += group[:2]
+    return {issue_id: by_id.get(issue_id, {}).get('title', 'Untitled') for issue_id in shown}
+
+def print_analysis(analysis: Dict):
+    """Print the analysis summary, using the titles stored alongside it"""
+    titles = analysis.get('titles', {})
+
+    def describe(issue_id):
+        return f"{titles.get(issue_id, 'Untitled')} (ID: {issue_id})"
+
+    print(f"\n📊 Workflow Analysis Results:")
+    print(f"Total issues: {analysis['total_issues']}")
+    print(f"Ready for execution: {analysis['ready_count']}")
+    print(f"Blocked issues: {analysis['blocked_count']}")
+
+    if analysis['blocked_count'] > 0:
+        print(f"\n⚠️  Blocked Issues:")
+        for issue_id in analysis['blocking_issues'][:3]:  # Show first 3
+            print(f"  - {describe(issue_id)}")
+        if len(analysis['blocking_issues']) > 3:
+            print(f"  ... and {len(analysis['blocking_issues']) - 3} more")
+
+    if analysis['ready_count'] > 0:
+        print(f"\n✅ Ready for Execution:")
+        for issue_id in analysis['ready_issues'][:3]:  # Show first 3
+            print(f"  - {describe(issue_id)}")
+        if len(analysis['ready_issues']) > 3:
+            print(f"  ... and {len(analysis['ready_issues']) - 3} more")
+
+    parallel_groups = analysis.get('parallel_groups', [])
+    print(f"\n🚀 Parallel Execution Groups: {len(parallel_groups)}")
+    for i, group in enumerate(parallel_groups[:2]):  # Show first 2 groups
+        print(f"  Group {i+1}: {len(group)} tasks")
+        for issue_id in group[:2]:  # Show first 2 in each group
+            print(f"    - {describe(issue_id)}")
+        if len(group) > 2:
+            print(f"    ... and {len(group) - 2} more")
+    if len(parallel_groups) > 2:
+        print(f"  ... and {len(parallel_groups) - 2} more groups")
+
+def main(issues: Optional[List[Dict]] = None, force: bool = False) -> Dict:
+    """Main analysis function; pass already-loaded issues to skip reading issues.json"""
     print("🔍 Analyzing Beads workflow...")
 
     try:
-        issues = load_beads_data()
+        issues_file = Path('.beads') / 'issues.json'
+        output_file = Path('.beads') / 'workflow_analysis.json'
+        source_fp = file_fingerprint(issues_file)
+        if issues is None:
+            cached = None if force else load_cached(output_file, issues_file)
+            if cached is not None:
+                print_analysis(cached)
+                print(f"\n♻️  {issues_file} unchanged, analysis is up to date: {output_file}")
+                return cached
+            issues = load_beads_data()
+
         analysis = analyze_dependencies(issues)
+        analysis['_src_fp'] = source_fp
+
+        # Find parallel execution groups, draining the critical path first;
+        # the Kahn levels are built once and shared by both passes
+        topology = _topological_levels(issues, analysis['dependency_map'])
+        analysis['criticality'] = compute_criticality(issues, analysis['dependency_map'], topology)
+        parallel_groups = find_parallel_groups(issues, analysis['dependency_map'], analysis['criticality'], topology)
+        analysis['parallel_groups'] = [[issue.get('id') for issue in group] for group in parallel_groups]
 
-        print(f"\n📊 Workflow Analysis Results:")
-        print(f"Total issues: {analysis['total_issues']}")
-        print(f"Ready for execution: {analysis['ready_count']}")
-        print(f"Blocked issues: {analysis['blocked_count']}")
-
-        if analysis['blocked_count'] > 0:
-            print(f"\n⚠️  Blocked Issues:")
-            for issue in analysis['blocking_issues'][:3]:  # Show first 3
-                print(f"  - {issue.get('title', 'Untitled')} (ID: {issue.get('id')})")
-            if len(analysis['blocking_issues']) > 3:
-                print(f"  ... and {len(analysis['blocking_issues']) - 3} more")
-
-        if analysis['ready_count'] > 0:
-            print(f"\n✅ Ready for Execution:")
-            for issue in analysis['ready_issues'][:3]:  # Show first 3
-                print(f"  - {issue.get('title', 'Untitled')} (ID: {issue.get('id')})")
-            if len(analysis['ready_issues']) > 3:
-                print(f"  ... and {len(analysis['ready_issues']) - 3} more")
-
-        # Find parallel execution groups
-        parallel_groups = find_parallel_groups(issues, analysis['dependency_map'])
-        print(f"\n🚀 Parallel Execution Groups: {len(parallel_groups)}")
-        for i, group in enumerate(parallel_groups[:2]):  # Show first 2 groups
-            print(f"  Group {i+1}: {len(group)} tasks")
-            for issue in group[:2]:  # Show first 2 in each group
-                print(f"    - {issue.get('title', 'Untitled')} (ID: {issue.get('id')})")
-            if len(group) > 2:
-                print(f"    ... and {len(group) - 2} more")
-        if len(parallel_groups) > 2:
-            print(f"  ... and {len(parallel_groups) - 2} more groups")
+        analysis['titles'] = summary_titles(analysis, topology[0])
+
+        print_analysis(analysis)
 
         # Save analysis results
-        output_file = Path('.beads') / 'workflow_analysis.json'
-        with open(output_file, 'w') as f:
-            json.dump(analysis, f, indent=2)
+        write_json(output_file, analysis)
 
         print(f"\n📁 Analysis saved to: {output_file}")
+        return analysis
 
     except Exception as e:
         print(f"❌ Analysis failed: {e}")
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(force='--force' in sys.argv[1:])
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Beads JSON I/O Helpers
+Shared JSON reading and writing for the Beads scripts, using orjson when available
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def read_json(path) -> Any:
+    """Parse a JSON file from its raw bytes"""
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def write_json(path, obj: Any, indent: bool = True):
+    """Serialize obj to a JSON file, pretty-printed unless indent is False"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_DATACLASS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        Path(path).write_bytes(orjson.dumps(obj, option=option))
+    else:
+        Path(path).write_text(json.dumps(obj, indent=2 if indent else None), encoding='utf-8')
+
+def json_line(obj: Any) -> bytes:
+    """Serialize obj as one compact newline-terminated NDJSON record"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, separators=(',', ':')) + '\n').encode('utf-8')
+
+def file_fingerprint(path) -> Optional[List[int]]:
+    """Cheap change detector for a file: [mtime_ns, size], or None if it is missing"""
+    try:
+        st = Path(path).stat()
+    except FileNotFoundError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+def load_cached(output_path, source_path) -> Optional[Dict]:
+    """Return a previous stage output if it was generated from the current source file"""
+    source_fp = file_fingerprint(source_path)
+    if source_fp is None or not Path(output_path).exists():
+        return None
+    try:
+        cached = read_json(output_path)
+    except ValueError:
+        return None
+    if isinstance(cached, dict) and cached.get('_src_fp') == source_fp:
+        return cached
+    return None
@@ -4,11 +4,12 @@ Beads Workflow Optimization Script
 Optimizes task execution order and parallel processing
 """
 
-import json
 import sys
 import os
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set
+
+from beads_io import file_fingerprint, load_cached, read_json, write_json
 
 def load_analysis_data():
     """Load workflow analysis data"""
@@ -17,44 +18,21 @@ def load_analysis_data():
         print("❌ No workflow analysis data found. Run 'scripts/analyze.py' first.")
         sys.exit(1)
 
-    with open(analysis_file, 'r') as f:
-        return json.load(f)
+    return read_json(analysis_file)
 
 def optimize_workflow(analysis: Dict) -> Dict:
-    """Optimize workflow based on analysis results"""
+    """Optimize workflow based on analysis results (groups hold issue ids)"""
     optimized = {
         'parallel_groups': [],
         'execution_order': [],
         'recommendations': []
     }
 
-    # Create parallel execution groups
-    parallel_groups = []
-    remaining_issues = analysis['ready_issues'].copy()
-
-    while remaining_issues:
-        current_group = []
-        issues_to_remove = []
-
-        for issue in remaining_issues:
-            issue_id = issue.get('id')
-            # Check if this issue depends on any issue in current group
-            can_add = True
-            for other_issue in current_group:
-                other_id = other_issue.get('id')
-                # Check dependencies (simplified - in real implementation would check full dependency map)
-                can_add = can_add and True  # Placeholder for dependency checking
-
-            if can_add:
-                current_group.append(issue)
-                issues_to_remove.append(issue)
-
-        if current_group:
-            parallel_groups.append(current_group)
-            for issue in issues_to_remove:
-                remaining_issues.remove(issue)
-        else:
-            break
+    # Ready issues have no open blockers, so they form a single group that can
+    # run together, ordered longest dependency chain first
+    criticality = analysis.get('criticality', {})
+    ready = sorted(dict.fromkeys(analysis['ready_issues']), key=lambda issue_id: -criticality.get(issue_id, 1))
+    parallel_groups = [ready] if ready else []
 
     optimized['parallel_groups'] = parallel_groups
 
@@ -80,33 +58,47 @@ def optimize_workflow(analysis: Dict) -> Dict:
 
     return optimized
 
-def main():
-    """Main optimization function"""
+def print_optimization(optimized: Dict):
+    """Print the optimization summary and recommendations"""
+    print(f"\n📊 Optimization Results:")
+    print(f"Parallel groups: {len(optimized['parallel_groups'])}")
+    print(f"Total executable tasks: {len(optimized['execution_order'])}")
+
+    if optimized['recommendations']:
+        print(f"\n💡 Recommendations:")
+        for rec in optimized['recommendations']:
+            print(f"  - {rec}")
+
+def main(analysis: Optional[Dict] = None, force: bool = False) -> Dict:
+    """Main optimization function; pass an in-memory analysis to skip reading it back"""
     print("🔧 Optimizing Beads workflow...")
 
     try:
-        analysis = load_analysis_data()
-        optimized = optimize_workflow(analysis)
+        analysis_file = Path('.beads') / 'workflow_analysis.json'
+        output_file = Path('.beads') / 'workflow_optimization.json'
+        source_fp = file_fingerprint(analysis_file)
+        if analysis is None:
+            cached = None if force else load_cached(output_file, analysis_file)
+            if cached is not None:
+                print_optimization(cached)
+                print(f"\n♻️  {analysis_file} unchanged, optimization is up to date: {output_file}")
+                return cached
+            analysis = load_analysis_data()
 
-        print(f"\n📊 Optimization Results:")
-        print(f"Parallel groups: {len(optimized['parallel_groups'])}")
-        print(f"Total executable tasks: {len(optimized['execution_order'])}")
+        optimized = optimize_workflow(analysis)
+        optimized['_src_fp'] = source_fp
 
-        if optimized['recommendations']:
-            print(f"\n💡 Recommendations:")
-            for rec in optimized['recommendations']:
-                print(f"  - {rec}")
+        print_optimization(optimized)
 
         # Save optimization results
-        output_file = Path('.beads') / 'workflow_optimization.json'
-        with open(output_file, 'w') as f:
-            json.dump(optimized, f, indent=2)
+        write_json(output_file, optimized)
 
         print(f"\n📁 Optimization saved to: {output_file}")
+        return optimized
 
     except Exception as e:
         print(f"❌ Optimization failed: {e}")
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(force='--force' in sys.argv[1:])
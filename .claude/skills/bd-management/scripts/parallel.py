@@ -4,13 +4,16 @@ Beads Parallel Execution Script
 Executes tasks in parallel when dependencies allow
 """
 
-import json
 import sys
 import os
 import subprocess
-import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+from beads_io import json_line, read_json, write_json
 
 def load_optimization_data():
     """Load workflow optimization data"""
@@ -19,11 +22,30 @@ def load_optimization_data():
         print("❌ No workflow optimization data found. Run 'scripts/optimize.py' first.")
         sys.exit(1)
 
-    with open(optimization_file, 'r') as f:
-        return json.load(f)
+    return read_json(optimization_file)
+
+def load_issues_by_id() -> Dict[str, Dict]:
+    """Index Beads issues by id, to resolve the ids stored in workflow outputs"""
+    issues_file = Path('.beads') / 'issues.json'
+    if not issues_file.exists():
+        return {}
+    return {issue.get('id'): issue for issue in read_json(issues_file)}
 
-def execute_task(task: Dict):
-    """Execute a single task"""
+def simulated_delay() -> Optional[float]:
+    """Seconds of simulated work per task from BEADS_SIMULATE(_SECS), or None when simulation is off"""
+    if os.getenv('BEADS_SIMULATE', '').strip().lower() in ('', '0', 'false', 'no', 'off'):
+        return None
+    raw = os.getenv('BEADS_SIMULATE_SECS', '2')
+    try:
+        seconds = float(raw)
+    except ValueError:
+        raise ValueError(f"BEADS_SIMULATE_SECS must be a number of seconds, got {raw!r}") from None
+    if seconds < 0:
+        raise ValueError(f"BEADS_SIMULATE_SECS must not be negative, got {raw!r}")
+    return seconds
+
+def execute_task(task: Dict, delay: Optional[float] = None):
+    """Execute a single task, sleeping delay seconds to simulate work when given"""
     task_id = task.get('id', 'unknown')
     task_title = task.get('title', 'Untitled')
 
@@ -32,9 +54,9 @@ def execute_task(task: Dict):
     # In a real implementation, this would execute the actual task
     # For now, simulate task execution
     try:
-        # Simulate task execution with a delay
-        import time
-        time.sleep(2)  # Simulate work
+        # Simulated work delay is opt-in, e.g. BEADS_SIMULATE=1 BEADS_SIMULATE_SECS=2
+        if delay is not None:
+            time.sleep(delay)
 
         print(f"✅ Completed task: {task_title} (ID: {task_id})")
         return True
@@ -42,38 +64,52 @@ def execute_task(task: Dict):
         print(f"❌ Task failed: {task_title} (ID: {task_id}) - {e}")
         return False
 
-def execute_parallel_groups(parallel_groups: List[List[Dict]]):
-    """Execute tasks in parallel groups"""
-    threads = []
+def execute_parallel_groups(parallel_groups: List[List[Dict]], progress_file: Optional[Path] = None,
+                            delay: Optional[float] = None):
+    """Execute tasks in parallel groups, appending an NDJSON record per finished task to progress_file"""
     results = []
 
-    for group_index, group in enumerate(parallel_groups):
-        print(f"\n🔄 Executing parallel group {group_index + 1} with {len(group)} tasks:")
+    with ExitStack() as stack:
+        # One worker pool is reused for every group; tasks are I/O-bound, so it is
+        # sized to the largest group to keep each whole group running at once
+        max_workers = max((len(group) for group in parallel_groups), default=1) or 1
+        executor = stack.enter_context(ThreadPoolExecutor(max_workers=max_workers))
+        progress = stack.enter_context(open(progress_file, 'wb')) if progress_file else None
+
+        for group_index, group in enumerate(parallel_groups):
+            print(f"\n🔄 Executing parallel group {group_index + 1} with {len(group)} tasks:")
 
-        group_threads = []
-        for task in group:
-            thread = threading.Thread(
-                target=lambda t=task: results.append(execute_task(t)),
-                daemon=True
-            )
-            group_threads.append(thread)
-            thread.start()
+            futures = {executor.submit(execute_task, task, delay): task for task in group}
 
-        # Wait for all threads in this group to complete
-        for thread in group_threads:
-            thread.join()
+            # Wait for all tasks in this group to complete; results are only
+            # collected on this thread, so progress writes need no lock
+            for future in as_completed(futures):
+                ok = future.result()
+                results.append(ok)
+                if progress is not None:
+                    progress.write(json_line({'id': futures[future].get('id'), 'ok': ok}))
+                    progress.flush()
 
-        print(f"✅ Group {group_index + 1} completed")
+            print(f"✅ Group {group_index + 1} completed")
 
     return results
 
-def main():
-    """Main parallel execution function"""
+def main(optimized: Optional[Dict] = None, issues: Optional[List[Dict]] = None) -> Dict:
+    """Main parallel execution function; in-memory inputs skip the matching file reads"""
     print("🚀 Executing Beads tasks in parallel...")
 
     try:
-        optimized = load_optimization_data()
-        parallel_groups = optimized.get('parallel_groups', [])
+        delay = simulated_delay()
+        if optimized is None:
+            optimized = load_optimization_data()
+        if issues is None:
+            by_id = load_issues_by_id()
+        else:
+            by_id = {issue.get('id'): issue for issue in issues}
+        parallel_groups = [
+            [by_id.get(issue_id, {'id': issue_id}) for issue_id in group]
+            for group in optimized.get('parallel_groups', [])
+        ]
 
         if not parallel_groups:
             print("❌ No parallel execution groups found. Run optimization first.")
@@ -81,7 +117,8 @@ def main():
 
         print(f"📊 Found {len(parallel_groups)} parallel groups with {sum(len(g) for g in parallel_groups)} total tasks")
 
-        results = execute_parallel_groups(parallel_groups)
+        progress_file = Path('.beads') / 'execution_progress.ndjson'
+        results = execute_parallel_groups(parallel_groups, progress_file, delay)
 
         success_count = sum(1 for r in results if r)
         failure_count = len(results) - success_count
@@ -93,15 +130,16 @@ def main():
 
         # Save execution results
         output_file = Path('.beads') / 'execution_results.json'
-        with open(output_file, 'w') as f:
-            json.dump({
-                'results': results,
-                'success_count': success_count,
-                'failure_count': failure_count,
-                'total_tasks': len(results)
-            }, f, indent=2)
+        execution = {
+            'results': results,
+            'success_count': success_count,
+            'failure_count': failure_count,
+            'total_tasks': len(results)
+        }
+        write_json(output_file, execution, indent=False)
 
         print(f"\n📁 Execution results saved to: {output_file}")
+        return execution
 
     except Exception as e:
         print(f"❌ Parallel execution failed: {e}")
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Beads Workflow Pipeline Script
+Runs analyze, optimize and parallel execution in one process on a single parse of issues.json
+"""
+
+import sys
+
+from analyze import load_beads_data, main as analyze_main
+from optimize import main as optimize_main
+from parallel import main as parallel_main
+
+def main():
+    """Main pipeline function"""
+    print("🔗 Running Beads workflow pipeline...")
+
+    try:
+        issues = load_beads_data()
+    except Exception as e:
+        print(f"❌ Pipeline failed: {e}")
+        sys.exit(1)
+
+    # Each stage still writes its output file, but hands its result to the next in memory
+    analysis = analyze_main(issues)
+    optimized = optimize_main(analysis)
+    parallel_main(optimized, issues)
+
+    print("\n✅ Beads workflow pipeline completed")
+
+if __name__ == "__main__":
+    main()
@@ -4,13 +4,19 @@ Beads Sync Script
 Synchronizes Beads workflow with git
 """
 
-import json
 import sys
 import os
 import subprocess
 from pathlib import Path
 from typing import Dict, List
 
+from beads_io import read_json, write_json
+
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
 def load_beads_data():
     """Load Beads data"""
     beads_dir = Path('.beads')
@@ -23,31 +29,63 @@ def load_beads_data():
         print("❌ No Beads issues found.")
         sys.exit(1)
 
-    with open(issues_file, 'r') as f:
-        return json.load(f)
+    return read_json(issues_file)
+
+def commit_beads_in_process(message: str) -> bool:
+    """Stage .beads/ and commit through pygit2 (git hooks do not run); returns False if nothing changed"""
+    repo_path = pygit2.discover_repository('.')
+    if repo_path is None:
+        print("❌ Git repository not found")
+        sys.exit(1)
+
+    repo = pygit2.Repository(repo_path)
+    beads_path = os.path.relpath(Path('.beads').resolve(), repo.workdir)
+    repo.index.add_all([f"{beads_path}/*"])
+    # add_all only stages new and modified files; drop entries for deleted
+    # ones too, matching what `git add .beads/` records
+    prefix = f"{Path(beads_path).as_posix()}/"
+    deleted = [entry.path for entry in repo.index
+               if entry.path.startswith(prefix) and not os.path.lexists(os.path.join(repo.workdir, entry.path))]
+    for path in deleted:
+        repo.index.remove(path)
+    repo.index.write()
+    tree = repo.index.write_tree()
+
+    parents = [] if repo.head_is_unborn else [repo.head.target]
+    if parents and repo[parents[0]].tree_id == tree:
+        return False
+
+    signature = repo.default_signature
+    repo.create_commit('HEAD', signature, signature, message, tree, parents)
+    return True
 
 def sync_with_git(issues: List[Dict]):
     """Synchronize Beads with git"""
     print("🔄 Synchronizing Beads with git...")
 
     try:
-        # Check git status
-        result = subprocess.run(['git', 'status', '--porcelain'], capture_output=True, text=True)
-        if result.returncode != 0:
-            print("❌ Git not available or repository not found")
-            sys.exit(1)
+        if pygit2 is None:
+            # Check git status
+            result = subprocess.run(['git', 'status', '--porcelain'], capture_output=True, text=True)
+            if result.returncode != 0:
+                print("❌ Git not available or repository not found")
+                sys.exit(1)
 
         # Save current Beads state
         beads_dir = Path('.beads')
         backup_file = beads_dir / 'issues_backup.json'
-        with open(backup_file, 'w') as f:
-            json.dump(issues, f, indent=2)
+        write_json(backup_file, issues)
 
         print(f"💾 Backup created: {backup_file}")
 
-        # Commit Beads changes
-        subprocess.run(['git', 'add', '.beads/'], check=True)
-        subprocess.run(['git', 'commit', '-m', 'Beads workflow sync'], check=True)
+        # Commit Beads changes, in-process when pygit2 is available
+        if pygit2 is not None:
+            if not commit_beads_in_process('Beads workflow sync'):
+                print("ℹ️  No Beads changes to commit")
+                return
+        else:
+            subprocess.run(['git', 'add', '.beads/'], check=True)
+            subprocess.run(['git', 'commit', '-m', 'Beads workflow sync'], check=True)
 
         print("✅ Beads synchronized with git")
 
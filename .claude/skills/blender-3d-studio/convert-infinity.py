@@ -1,52 +1,61 @@
 #!/usr/bin/env python3
 
 import bpy
+import bmesh
 import os
 import sys
+from mathutils import Vector
+from mathutils.geometry import interpolate_bezier
 
 def clear_scene():
     """Clear the default scene"""
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
-
-def create_infinity_3d():
-    """Create a 3D infinity symbol from scratch"""
-
-    # Create a simple 3D infinity symbol using curves
-    # We'll create a figure-8 shape with beveled curves
-
-    # Create a Bézier curve
-    bpy.ops.curve.primitive_bezier_curve_add()
-    curve_obj = bpy.context.active_object
-    curve_obj.name = "Infinity_Curve"
-
-    # Convert to mesh for extrusion
-    bpy.ops.object.convert(target='MESH')
-    infinity_obj = bpy.context.active_object
-    infinity_obj.name = "Infinity_3D"
-
-    # Enter Edit Mode to modify the curve points
-    bpy.ops.object.mode_set(mode='EDIT')
-    bpy.ops.curve.select_all(action='SELECT')
-
-    # Scale and position the curve
-    bpy.ops.transform.resize(value=(4, 2, 1))
-    bpy.ops.transform.translate(value=(0, 0, 0))
-
-    # Exit Edit Mode
-    bpy.ops.object.mode_set(mode='OBJECT')
-
-    # Apply transforms
-    bpy.ops.object.transform_apply(location=True, rotation=True, scale=True)
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+
+def link_object(name, data, location=(0, 0, 0)):
+    """Create an object for data and link it into the scene collection"""
+    obj = bpy.data.objects.new(name, data)
+    obj.location = location
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+def remove_objects_of_type(obj_type):
+    """Remove every object of the given type from the file"""
+    for obj in [o for o in bpy.data.objects if o.type == obj_type]:
+        bpy.data.objects.remove(obj, do_unlink=True)
+
+def create_infinity_3d(preview=True):
+    """Create a 3D infinity symbol from scratch (preview skips viewport-only subdivision)"""
+
+    # Sample the default Bezier primitive (two knots, resolution 12) directly
+    # instead of adding a curve object and converting it with bpy.ops
+    points = interpolate_bezier(
+        Vector((-1.0, 0.0, 0.0)), Vector((-0.5, 0.5, 0.0)),
+        Vector((0.5, -0.5, 0.0)), Vector((1.0, 0.0, 0.0)),
+        13,
+    )
+
+    # Scale the curve into the final shape up front, so no transform needs applying
+    bm = bmesh.new()
+    verts = [bm.verts.new((p.x * 4, p.y * 2, p.z)) for p in points]
+    for v1, v2 in zip(verts, verts[1:]):
+        bm.edges.new((v1, v2))
+
+    mesh = bpy.data.meshes.new("Infinity_3D")
+    bm.to_mesh(mesh)
+    bm.free()
+
+    infinity_obj = link_object("Infinity_3D", mesh)
 
     # Add Solidify modifier for 3D extrusion
     solidify = infinity_obj.modifiers.new(name="Solidify", type='SOLIDIFY')
     solidify.thickness = 0.3
     solidify.offset = 1.0
 
-    # Add Subdivision Surface for smooth curves
+    # Add Subdivision Surface for smooth curves; preview skips it in the
+    # viewport while renders still use render_levels
     subdivision = infinity_obj.modifiers.new(name="Subdivision", type='SUBSURF')
-    subdivision.levels = 2
+    subdivision.levels = 0 if preview else 2
     subdivision.render_levels = 3
 
     # Add Bevel for rounded edges
@@ -96,39 +105,29 @@ def setup_lighting():
     """Setup professional lighting"""
 
     # Clear existing lights
-    bpy.ops.object.select_by_type(type='LIGHT')
-    bpy.ops.object.delete()
+    remove_objects_of_type('LIGHT')
 
     # Key light
-    bpy.ops.object.light_add(type='SUN', location=(5, -5, 5))
-    key_light = bpy.context.active_object
-    key_light.name = "Key_Light"
+    key_light = link_object("Key_Light", bpy.data.lights.new("Key_Light", type='SUN'), (5, -5, 5))
     key_light.data.energy = 800
 
     # Fill light
-    bpy.ops.object.light_add(type='SUN', location=(-3, -5, 3))
-    fill_light = bpy.context.active_object
-    fill_light.name = "Fill_Light"
+    fill_light = link_object("Fill_Light", bpy.data.lights.new("Fill_Light", type='SUN'), (-3, -5, 3))
     fill_light.data.energy = 400
-    fill_light.data.color = (0.9, 0.9, 1.0, 1.0)
+    fill_light.data.color = (0.9, 0.9, 1.0)
 
     # Back light
-    bpy.ops.object.light_add(type='SUN', location=(0, 5, 3))
-    back_light = bpy.context.active_object
-    back_light.name = "Back_Light"
+    back_light = link_object("Back_Light", bpy.data.lights.new("Back_Light", type='SUN'), (0, 5, 3))
     back_light.data.energy = 200
 
 def setup_camera():
     """Setup camera"""
 
     # Clear existing cameras
-    bpy.ops.object.select_by_type(type='CAMERA')
-    bpy.ops.object.delete()
+    remove_objects_of_type('CAMERA')
 
     # Add camera
-    bpy.ops.object.camera_add(location=(0, -8, 2))
-    camera = bpy.context.active_object
-    camera.name = "Camera"
+    camera = link_object("Camera", bpy.data.cameras.new("Camera"), (0, -8, 2))
 
     # Point camera at origin
     direction = -camera.location
@@ -167,9 +166,16 @@ def setup_render_settings():
         bg_node.inputs['Color'].default_value = (0.8, 0.8, 0.8, 1.0)
         world.node_tree.links.new(bg_node.outputs['Background'], output_node.inputs['Background'])
 
+def script_args():
+    """Arguments given after Blender's '--' separator"""
+    if '--' in sys.argv:
+        return sys.argv[sys.argv.index('--') + 1:]
+    return []
+
 def main():
     """Main conversion function"""
     print("Starting 2D to 3D conversion of infinity symbol...")
+    no_save = '--no-save' in script_args()
 
     # Clear scene
     clear_scene()
@@ -188,6 +194,11 @@ def main():
     setup_render_settings()
     print("Setup professional lighting and camera")
 
+    # Headless render runs only need the in-memory scene, not a .blend on disk
+    if no_save:
+        print("Conversion completed successfully (--no-save: .blend not written)")
+        return
+
     # Save the result
     output_file = 'infinity_3d.blend'
     bpy.ops.wm.save_as_mainfile(filepath=output_file)
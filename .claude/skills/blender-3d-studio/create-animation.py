@@ -2,7 +2,23 @@
 
 import bpy
 import os
-import math
+import numpy as np
+
+FRAME_COUNT = 180  # 6 seconds at 30fps
+
+def insert_keyframes(action, data_path, frames, channels):
+    """Write one fcurve per channel in a single batched upload, without frame_set"""
+    count = len(frames)
+    for index, values in enumerate(channels):
+        fcurve = action.fcurves.new(data_path=data_path, index=index)
+        fcurve.keyframe_points.add(count)
+
+        # Interleave (frame, value) pairs; new points default to Bezier interpolation
+        co = np.empty(count * 2, dtype=np.float32)
+        co[0::2] = frames
+        co[1::2] = values
+        fcurve.keyframe_points.foreach_set('co', co)
+        fcurve.update()
 
 def animate_infinity():
     """Create animation for the 3D infinity symbol"""
@@ -11,14 +27,10 @@ def animate_infinity():
 
     # Set frame rate and duration
     scene.render.fps = 30
-    scene.frame_end = 180  # 6 seconds at 30fps
+    scene.frame_end = FRAME_COUNT
 
     # Get the infinity object
-    infinity_obj = None
-    for obj in scene.objects:
-        if obj.name == "Infinity_3D":
-            infinity_obj = obj
-            break
+    infinity_obj = bpy.data.objects.get("Infinity_3D")
 
     if not infinity_obj:
         print("Error: Infinity_3D object not found!")
@@ -26,31 +38,20 @@ def animate_infinity():
 
     # Clear existing animation
     infinity_obj.animation_data_clear()
+    action = bpy.data.actions.new("InfinityAnim")
+    infinity_obj.animation_data_create().action = action
 
-    # Create rotation animation
     # Rotate around multiple axes for interesting effect
-    for frame in range(1, 181):
-        scene.frame_set(frame)
-        t = frame / 180.0  # Normalized time (0 to 1)
-
-        # Rotation animation
-        rotation_x = math.sin(t * math.pi * 2) * 0.3
-        rotation_y = math.sin(t * math.pi * 2) * 0.7
-        rotation_z = t * math.pi * 2
+    frames = np.arange(1, FRAME_COUNT + 1, dtype=np.float32)
+    t = frames / FRAME_COUNT  # Normalized time (0 to 1)
+    wave = np.sin(t * np.pi * 2)
 
-        infinity_obj.rotation_euler = (rotation_x, rotation_y, rotation_z)
-        infinity_obj.keyframe_insert(data_path="rotation_euler", frame=frame)
+    # Rotation animation
+    insert_keyframes(action, "rotation_euler", frames, (wave * 0.3, wave * 0.7, t * np.pi * 2))
 
-        # Scale animation (subtle breathing effect)
-        scale_factor = 1.0 + math.sin(t * math.pi * 4) * 0.05
-        infinity_obj.scale = (scale_factor, scale_factor, scale_factor)
-        infinity_obj.keyframe_insert(data_path="scale", frame=frame)
-
-    # Set interpolation to smooth
-    if infinity_obj.animation_data and infinity_obj.animation_data.action:
-        for fcurve in infinity_obj.animation_data.action.fcurves:
-            for keyframe in fcurve.keyframe_points:
-                keyframe.interpolation = 'BEZIER'
+    # Scale animation (subtle breathing effect)
+    scale_factor = 1.0 + np.sin(t * np.pi * 4) * 0.05
+    insert_keyframes(action, "scale", frames, (scale_factor, scale_factor, scale_factor))
 
     return True
 
@@ -74,34 +75,28 @@ def setup_camera_animation():
     radius = 8.0
     height = 2.0
 
-    for frame in range(1, 181):
-        scene.frame_set(frame)
-        t = frame / 180.0
-
-        # Orbital movement
-        angle = t * math.pi * 2  # Full circle
-
-        x = math.cos(angle) * radius
-        y = math.sin(angle) * radius
-        z = height + math.sin(angle * 2) * 1.0  # Vertical variation
+    frames = np.arange(1, FRAME_COUNT + 1, dtype=np.float32)
+    t = frames / FRAME_COUNT
 
-        camera.location = (x, y, z)
+    # Orbital movement
+    angle = t * np.pi * 2  # Full circle
 
-        # Point camera at origin with slight up/down movement
-        target_height = math.sin(angle) * 0.5
-        direction = -camera.location
-        direction[2] += target_height
-        rot_quat = direction.to_track_quat('-Z', 'Y')
-        camera.rotation_euler = rot_quat.to_euler()
+    x = np.cos(angle) * radius
+    y = np.sin(angle) * radius
+    z = height + np.sin(angle * 2) * 1.0  # Vertical variation
 
-        camera.keyframe_insert(data_path="location", frame=frame)
-        camera.keyframe_insert(data_path="rotation_euler", frame=frame)
+    # Point camera at origin with slight up/down movement. For a -Z forward,
+    # Y up camera, direction.to_track_quat('-Z', 'Y').to_euler() reduces to
+    # a pitch about X and a yaw about Z with no roll.
+    target_height = np.sin(angle) * 0.5
+    dx, dy, dz = -x, -y, target_height - z
+    rotation_x = np.arctan2(np.hypot(dx, dy), -dz)
+    rotation_z = np.arctan2(-dx, dy)
 
-    # Set interpolation
-    if camera.animation_data and camera.animation_data.action:
-        for fcurve in camera.animation_data.action.fcurves:
-            for keyframe in fcurve.keyframe_points:
-                keyframe.interpolation = 'BEZIER'
+    action = bpy.data.actions.new("CameraAnim")
+    camera.animation_data_create().action = action
+    insert_keyframes(action, "location", frames, (x, y, z))
+    insert_keyframes(action, "rotation_euler", frames, (rotation_x, np.zeros_like(t), rotation_z))
 
     return True
 
@@ -112,7 +107,7 @@ def setup_animation_settings():
 
     # Animation settings
     scene.frame_start = 1
-    scene.frame_end = 180
+    scene.frame_end = FRAME_COUNT
     scene.render.fps = 30
 
     # Output settings
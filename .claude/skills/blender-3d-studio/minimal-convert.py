@@ -3,57 +3,86 @@
 import bpy
 import os
 import math
+import numpy as np
+
+# Torus resolution matching the default primitive (48 x 12) after two subdivide cuts
+MAJOR_SEGMENTS = 144
+MINOR_SEGMENTS = 36
 
 def clear_scene():
     """Clear the default scene"""
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+
+def foreach_upload(collection, attr, buffer, dtype):
+    """foreach_set from a contiguous buffer of Blender's native C type, so it is a memcpy"""
+    assert buffer.dtype == dtype and buffer.flags['C_CONTIGUOUS'], \
+        f"{attr} upload needs a contiguous {np.dtype(dtype).name} buffer, got {buffer.dtype}"
+    collection.foreach_set(attr, buffer.ravel())
+
+def torus_geometry(center_x, tilt, major_radius=1.0, minor_radius=0.3):
+    """Vertices and quad indices of a torus tilted about Y and moved along X"""
+    u = np.linspace(0, 2 * np.pi, MAJOR_SEGMENTS, endpoint=False, dtype=np.float32)
+    v = np.linspace(0, 2 * np.pi, MINOR_SEGMENTS, endpoint=False, dtype=np.float32)
+    u, v = np.meshgrid(u, v, indexing='ij')
+
+    ring = major_radius + minor_radius * np.cos(v)
+    verts = np.stack((ring * np.cos(u), ring * np.sin(u), minor_radius * np.sin(v)), axis=-1).reshape(-1, 3)
+
+    # Rotate about Y in NumPy instead of bpy.ops.transform.rotate
+    c, s = math.cos(tilt), math.sin(tilt)
+    rotation = np.array(((c, 0, s), (0, 1, 0), (-s, 0, c)), dtype=np.float32)
+    verts = verts @ rotation.T
+    verts[:, 0] += center_x
+
+    # One quad per (major, minor) cell, wrapping around both rings
+    i, j = np.meshgrid(np.arange(MAJOR_SEGMENTS), np.arange(MINOR_SEGMENTS), indexing='ij')
+    i1 = (i + 1) % MAJOR_SEGMENTS
+    j1 = (j + 1) % MINOR_SEGMENTS
+    faces = np.stack((
+        i * MINOR_SEGMENTS + j,
+        i1 * MINOR_SEGMENTS + j,
+        i1 * MINOR_SEGMENTS + j1,
+        i * MINOR_SEGMENTS + j1,
+    ), axis=-1).reshape(-1, 4).astype(np.intc)
+
+    return verts, faces
 
 def create_3d_infinity():
     """Create a 3D infinity symbol using basic meshes"""
 
-    # Create the infinity symbol using two torus objects
+    # Create the infinity symbol using two tori (left and right loops)
     # This simulates the figure-8 shape
+    # The angles are negated from the original transform.rotate values:
+    # rotating the view by +45 about Y leaves the object at rotation_euler.y = -45
+    left_verts, left_faces = torus_geometry(-1.5, math.radians(-45))
+    right_verts, right_faces = torus_geometry(1.5, math.radians(45))
+
+    # Join both loops into one buffer, offsetting the right loop's indices
+    verts = np.concatenate((left_verts, right_verts))
+    faces = np.concatenate((left_faces, right_faces + len(left_verts)))
+
+    # Upload everything into a single mesh, bypassing bpy.ops entirely
+    mesh = bpy.data.meshes.new("Infinity_3D")
+    mesh.vertices.add(len(verts))
+    positions = mesh.attributes.get("position")
+    if positions is not None:
+        foreach_upload(positions.data, "vector", verts, np.float32)
+    else:
+        foreach_upload(mesh.vertices, "co", verts, np.float32)
+
+    mesh.loops.add(faces.size)
+    foreach_upload(mesh.loops, "vertex_index", faces, np.intc)
+
+    mesh.polygons.add(len(faces))
+    foreach_upload(mesh.polygons, "loop_start", np.arange(0, faces.size, 4, dtype=np.intc), np.intc)
+    if not bpy.types.MeshPolygon.bl_rna.properties["loop_total"].is_readonly:
+        foreach_upload(mesh.polygons, "loop_total", np.full(len(faces), 4, dtype=np.intc), np.intc)
+
+    mesh.update(calc_edges=True)
 
-    # First torus (left loop)
-    bpy.ops.mesh.primitive_torus_add(
-        location=(-1.5, 0, 0),
-        major_radius=1.0,
-        minor_radius=0.3
-    )
-    torus1 = bpy.context.active_object
-    torus1.name = "Infinity_Left"
-
-    # Apply transformations to create the left loop
-    bpy.ops.transform.rotate(value=math.radians(45), orient_axis='Y')
-    bpy.ops.object.transform_apply(rotation=True, scale=True)
-
-    # Second torus (right loop)
-    bpy.ops.mesh.primitive_torus_add(
-        location=(1.5, 0, 0),
-        major_radius=1.0,
-        minor_radius=0.3
-    )
-    torus2 = bpy.context.active_object
-    torus2.name = "Infinity_Right"
-
-    # Apply transformations to create the right loop
-    bpy.ops.transform.rotate(value=math.radians(-45), orient_axis='Y')
-    bpy.ops.object.transform_apply(rotation=True, scale=True)
-
-    # Join both objects
-    bpy.ops.object.select_all(action='SELECT')
-    torus1.select_set(True)
-    bpy.context.view_layer.objects.active = torus1
-    bpy.ops.object.join()
-
-    infinity_obj = bpy.context.active_object
-    infinity_obj.name = "Infinity_3D"
-
-    # Add some subdivisions for smoother curves
-    bpy.ops.object.mode_set(mode='EDIT')
-    bpy.ops.mesh.subdivide(number_cuts=2)
-    bpy.ops.object.mode_set(mode='OBJECT')
+    infinity_obj = bpy.data.objects.new("Infinity_3D", mesh)
+    bpy.context.scene.collection.objects.link(infinity_obj)
 
     # Add modifiers for 3D effect
     solidify = infinity_obj.modifiers.new(name="Solidify", type='SOLIDIFY')
@@ -122,53 +151,53 @@ def create_material():
 def setup_basic_scene():
     """Setup basic scene with lighting and camera"""
 
-    # Simple lighting
-    # Clear existing lights
-    bpy.ops.object.select_by_type(type='LIGHT')
-    bpy.ops.object.delete()
-
-    # Key light
-    bpy.ops.object.light_add(type='SUN', location=(5, -5, 5))
-    key_light = bpy.context.active_object
-    key_light.name = "Key_Light"
-    key_light.data.energy = 800
-
-    # Fill light
-    bpy.ops.object.light_add(type='SUN', location=(-3, -5, 3))
-    fill_light = bpy.context.active_object
-    fill_light.name = "Fill_Light"
-    fill_light.data.energy = 400
-    fill_light.data.color = (0.9, 0.9, 1.0)
-
-    # Back light
-    bpy.ops.object.light_add(type='SUN', location=(0, 5, 3))
-    back_light = bpy.context.active_object
-    back_light.name = "Back_Light"
-    back_light.data.energy = 200
+    scene = bpy.context.scene
 
-    # Camera setup
-    bpy.ops.object.select_by_type(type='CAMERA')
-    bpy.ops.object.delete()
+    # Clear existing lights and cameras
+    for obj in [o for o in bpy.data.objects if o.type in {'LIGHT', 'CAMERA'}]:
+        bpy.data.objects.remove(obj, do_unlink=True)
+
+    # Simple lighting: key, fill and back suns created straight from bpy.data
+    for name, location, energy, color in (
+        ("Key_Light", (5, -5, 5), 800, None),
+        ("Fill_Light", (-3, -5, 3), 400, (0.9, 0.9, 1.0)),
+        ("Back_Light", (0, 5, 3), 200, None),
+    ):
+        light_data = bpy.data.lights.new(name=name, type='SUN')
+        light_data.energy = energy
+        if color:
+            light_data.color = color
+        light = bpy.data.objects.new(name, light_data)
+        light.location = location
+        scene.collection.objects.link(light)
 
-    bpy.ops.object.camera_add(location=(0, -8, 2))
-    camera = bpy.context.active_object
-    camera.name = "Camera"
+    # Camera setup
+    camera = bpy.data.objects.new("Camera", bpy.data.cameras.new(name="Camera"))
+    camera.location = (0, -8, 2)
+    scene.collection.objects.link(camera)
 
     # Point camera at origin
     direction = -camera.location
     rot_quat = direction.to_track_quat('-Z', 'Y')
     camera.rotation_euler = rot_quat.to_euler()
 
-    bpy.context.scene.camera = camera
+    scene.camera = camera
 
-    # Simple render settings
-    scene = bpy.context.scene
-    scene.render.engine = 'CYCLES'
+    # Simple render settings: a rasterized EEVEE preview by default,
+    # BLENDER_RENDER_ENGINE=CYCLES for the path-traced look
+    engines = scene.render.bl_rna.properties['engine'].enum_items.keys()
+    default_engine = 'BLENDER_EEVEE_NEXT' if 'BLENDER_EEVEE_NEXT' in engines else 'BLENDER_EEVEE'
+    engine = os.environ.get('BLENDER_RENDER_ENGINE', default_engine)
+
+    scene.render.engine = engine
     scene.render.resolution_x = 1920
     scene.render.resolution_y = 1080
     scene.render.resolution_percentage = 25
-    scene.cycles.samples = 32
-    scene.cycles.use_denoising = True
+    if engine == 'CYCLES':
+        scene.cycles.samples = 32
+        scene.cycles.use_denoising = True
+    else:
+        scene.eevee.taa_render_samples = 16
 
 def main():
     """Main conversion function"""
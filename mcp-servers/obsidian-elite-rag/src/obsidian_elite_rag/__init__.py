@@ -14,10 +14,25 @@ __author__ = "Mattae Cooper"
 __email__ = "research@aegntic.ai"
 __license__ = "MIT"
 
-from .core.rag_engine import MultiLayerRAG
-from .core.graphiti_adapter import GraphitiAdapter
-from .server import create_server
-from .cli import main as cli_main
+# Public names are resolved on first access so that importing the CLI does
+# not pull in the embedding, vector store and graph database dependencies.
+_LAZY_EXPORTS = {
+    "MultiLayerRAG": (".core.rag_engine", "MultiLayerRAG"),
+    "GraphitiAdapter": (".core.graphiti_adapter", "GraphitiAdapter"),
+    "create_server": (".server", "create_server"),
+    "cli_main": (".cli", "main"),
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        from importlib import import_module
+
+        module_name, attr = _LAZY_EXPORTS[name]
+        value = getattr(import_module(module_name, __name__), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     "MultiLayerRAG",
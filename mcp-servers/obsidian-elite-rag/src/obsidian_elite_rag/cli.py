@@ -11,14 +11,16 @@ License: MIT
 """
 
 import asyncio
+import atexit
 import click
 import logging
+import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
-from .core.rag_engine import MultiLayerRAG
-from .server import main as server_main
+if TYPE_CHECKING:
+    from .core.rag_engine import MultiLayerRAG
 
 # Configure logging
 logging.basicConfig(
@@ -28,6 +30,58 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Process-lifetime RAG instances, keyed by (vault_path, config)
+_rag_instances: Dict[Tuple[Path, str], "MultiLayerRAG"] = {}
+
+
+def _get_rag(vault_path: Path, config: str) -> "MultiLayerRAG":
+    """Return the shared RAG instance for a vault/config pair, creating it on first use."""
+    key = (vault_path, config)
+    rag = _rag_instances.get(key)
+    if rag is None:
+        # Imported here so --help and setup don't load the embedding and graph stacks
+        from .core.rag_engine import MultiLayerRAG
+        rag = _rag_instances[key] = MultiLayerRAG(vault_path, config)
+    return rag
+
+
+@atexit.register
+def _close_rags() -> None:
+    """Close graph driver sessions held by shared RAG instances."""
+    for rag in _rag_instances.values():
+        if rag.graphiti_adapter:
+            rag.graphiti_adapter.close()
+
+
+# Number of result entries written per click.echo call in listings
+_ECHO_BATCH = 256
+
+
+def _echo_lines(lines: list) -> None:
+    """Write buffered output lines with a single click.echo call and clear the buffer."""
+    if lines:
+        click.echo("\n".join(lines))
+        lines.clear()
+
+
+def _count_markdown_files(root: Path) -> int:
+    """Count markdown files under root without building Path objects or extra stat calls."""
+    count = 0
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".md"):
+                        count += 1
+        except OSError:
+            # Unreadable directories are skipped, as Path.rglob does
+            continue
+    return count
+
+
 @click.group()
 @click.version_option(version="1.0.0", prog_name="obsidian-elite-rag")
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
@@ -42,13 +96,13 @@ def cli(verbose: bool):
 
 
 @cli.command()
-@click.argument("vault_path", type=click.Path(exists=True, file_okay=False, dir_okay=True))
+@click.argument("vault_path", type=click.Path(exists=True, file_okay=False, dir_okay=True, resolve_path=True, path_type=Path))
 @click.option("--config", "-c", type=click.Path(exists=True), help="Path to configuration file")
 @click.option("--watch", is_flag=True, help="Watch for file changes and auto-update")
-async def ingest(vault_path: str, config: Optional[str], watch: bool):
+async def ingest(vault_path: Path, config: Optional[str], watch: bool):
     """Ingest markdown files from an Obsidian vault into the RAG system."""
     try:
-        rag = MultiLayerRAG(vault_path, config or "")
+        rag = _get_rag(vault_path, config or "")
 
         click.echo(f"🚀 Starting ingestion of vault: {vault_path}")
         await rag.ingest_vault()
@@ -66,16 +120,16 @@ async def ingest(vault_path: str, config: Optional[str], watch: bool):
 
 @cli.command()
 @click.argument("query")
-@click.argument("vault_path", type=click.Path(exists=True, file_okay=False, dir_okay=True))
+@click.argument("vault_path", type=click.Path(exists=True, file_okay=False, dir_okay=True, resolve_path=True, path_type=Path))
 @click.option("--query-type", "-t",
               type=click.Choice(["general", "technical", "research", "workflow"]),
               default="general", help="Type of query for domain specialization")
 @click.option("--limit", "-l", default=10, help="Maximum number of results")
 @click.option("--config", "-c", type=click.Path(exists=True), help="Path to configuration file")
-async def query(query: str, vault_path: str, query_type: str, limit: int, config: Optional[str]):
+async def query(query: str, vault_path: Path, query_type: str, limit: int, config: Optional[str]):
     """Query the elite RAG system with multi-layer retrieval."""
     try:
-        rag = MultiLayerRAG(vault_path, config or "")
+        rag = _get_rag(vault_path, config or "")
 
         click.echo(f"🔍 Querying RAG system: {query}")
         documents = await rag.retrieve(query, query_type, limit=limit)
@@ -86,56 +140,76 @@ async def query(query: str, vault_path: str, query_type: str, limit: int, config
 
         click.echo(f"\n📊 Found {len(documents)} results:\n")
 
+        lines = []
         for i, doc in enumerate(documents, 1):
             source = doc.metadata.get('source', 'Unknown')
             title = doc.metadata.get('title', 'Untitled')
             retrieval_method = doc.metadata.get('retrieval_method', 'unknown')
 
-            click.echo(f"{i}. {title}")
-            click.echo(f"   Source: {source}")
-            click.echo(f"   Method: {retrieval_method}")
-            click.echo(f"   Content: {doc.content[:200]}...")
-            click.echo()
+            lines.append(f"{i}. {title}")
+            lines.append(f"   Source: {source}")
+            lines.append(f"   Method: {retrieval_method}")
+            lines.append(f"   Content: {doc.content[:200]}...")
+            lines.append("")
+            if i % _ECHO_BATCH == 0:
+                _echo_lines(lines)
+        _echo_lines(lines)
 
     except Exception as e:
         click.echo(f"❌ Query failed: {str(e)}", err=True)
         sys.exit(1)
 
 
+def _check_qdrant(rag: "MultiLayerRAG") -> list:
+    """List Qdrant collections; raises if the server is unreachable."""
+    return rag.qdrant_client.get_collections().collections
+
+
+def _check_neo4j(rag: "MultiLayerRAG") -> None:
+    """Run a trivial query against Neo4j; raises if the server is unreachable."""
+    if rag.graphiti_adapter:
+        with rag.graphiti_adapter.driver.session() as session:
+            session.run("RETURN 1")
+
+
 @cli.command()
-@click.argument("vault_path", type=click.Path(exists=True, file_okay=False, dir_okay=True))
+@click.argument("vault_path", type=click.Path(exists=True, file_okay=False, dir_okay=True, resolve_path=True, path_type=Path))
 @click.option("--config", "-c", type=click.Path(exists=True), help="Path to configuration file")
-async def status(vault_path: str, config: Optional[str]):
+async def status(vault_path: Path, config: Optional[str]):
     """Get system status including database connections."""
     try:
-        rag = MultiLayerRAG(vault_path, config or "")
+        rag = _get_rag(vault_path, config or "")
 
         click.echo("🔍 System Status\n")
 
+        # Probe the vault, Qdrant and Neo4j concurrently; they are independent I/O
+        md_count, collections, neo4j_result = await asyncio.gather(
+            asyncio.to_thread(_count_markdown_files, vault_path),
+            asyncio.to_thread(_check_qdrant, rag),
+            asyncio.to_thread(_check_neo4j, rag),
+            return_exceptions=True,
+        )
+
         # Check vault
-        vault_path_obj = Path(vault_path)
-        md_files = list(vault_path_obj.rglob("*.md"))
-        click.echo(f"✅ Vault: {vault_path} ({len(md_files)} markdown files)")
+        if isinstance(md_count, Exception):
+            raise md_count
+        click.echo(f"✅ Vault: {vault_path} ({md_count} markdown files)")
 
         # Check Qdrant
-        try:
-            collections = rag.qdrant_client.get_collections().collections
-            if any(c.name == rag.collection_name for c in collections):
-                click.echo(f"✅ Qdrant: Connected (collection '{rag.collection_name}' exists)")
-            else:
-                click.echo("⚠️ Qdrant: Connected (collection not found)")
-        except Exception as e:
-            click.echo(f"❌ Qdrant: Connection failed - {str(e)}")
+        if isinstance(collections, Exception):
+            click.echo(f"❌ Qdrant: Connection failed - {str(collections)}")
+        elif any(c.name == rag.collection_name for c in collections):
+            click.echo(f"✅ Qdrant: Connected (collection '{rag.collection_name}' exists)")
+        else:
+            click.echo("⚠️ Qdrant: Connected (collection not found)")
 
         # Check Neo4j/Graphiti
         if rag.graphiti_adapter:
-            try:
-                with rag.graphiti_adapter.driver.session() as session:
-                    session.run("RETURN 1")
+            if isinstance(neo4j_result, Exception):
+                click.echo(f"❌ Neo4j: Connection failed - {str(neo4j_result)}")
+            else:
                 click.echo("✅ Neo4j: Connected")
                 click.echo("✅ Graphiti: Enabled")
-            except Exception as e:
-                click.echo(f"❌ Neo4j: Connection failed - {str(e)}")
         else:
             click.echo("⚠️ Graphiti: Disabled")
 
@@ -160,20 +234,22 @@ def server():
     click.echo("Organization: Aegntic AI (https://aegntic.ai)")
     click.echo()
 
+    from .server import main as server_main
+
     asyncio.run(server_main())
 
 
 @cli.command()
-@click.argument("vault_path", type=click.Path(exists=True, file_okay=False, dir_okay=True))
+@click.argument("vault_path", type=click.Path(exists=True, file_okay=False, dir_okay=True, resolve_path=True, path_type=Path))
 @click.option("--config", "-c", type=click.Path(exists=True), help="Path to configuration file")
 @click.option("--entity-query", "-e", help="Search for specific entities")
 @click.option("--entity-types", "-t", multiple=True,
               default=["concept", "person", "organization", "technology"],
               help="Entity types to search for")
-async def graph(vault_path: str, config: Optional[str], entity_query: Optional[str], entity_types: tuple):
+async def graph(vault_path: Path, config: Optional[str], entity_query: Optional[str], entity_types: tuple):
     """Interact with the Graphiti knowledge graph."""
     try:
-        rag = MultiLayerRAG(vault_path, config or "")
+        rag = _get_rag(vault_path, config or "")
 
         if not rag.graphiti_adapter:
             click.echo("❌ Graphiti is not available. Please ensure Neo4j is running.")
@@ -190,24 +266,26 @@ async def graph(vault_path: str, config: Optional[str], entity_query: Optional[s
 
             click.echo(f"\n📊 Found {len(entities)} entities:\n")
 
-            for entity in entities:
-                click.echo(f"• {entity['name']} ({entity['type']})")
-                click.echo(f"  {entity['description'][:100]}...")
-                click.echo()
+            lines = []
+            for i, entity in enumerate(entities, 1):
+                lines.append(f"• {entity['name']} ({entity['type']})")
+                lines.append(f"  {entity['description'][:100]}...")
+                lines.append("")
+                if i % _ECHO_BATCH == 0:
+                    _echo_lines(lines)
+            _echo_lines(lines)
 
         else:
             # Show graph statistics
             click.echo("📊 Knowledge Graph Statistics")
 
             # Get entity counts by type
-            entity_type_counts = {}
-            for entity_type in entity_types:
-                entities = await rag.graphiti_adapter.search_entities("", [entity_type], 1000)
-                entity_type_counts[entity_type] = len(entities)
+            entity_type_counts = await rag.graphiti_adapter.count_entities_by_type(list(entity_types))
 
-            click.echo("\nEntity Types:")
+            lines = ["\nEntity Types:"]
             for entity_type, count in entity_type_counts.items():
-                click.echo(f"  • {entity_type}: {count} entities")
+                lines.append(f"  • {entity_type}: {count} entities")
+            _echo_lines(lines)
 
     except Exception as e:
         click.echo(f"❌ Graph operation failed: {str(e)}", err=True)
@@ -494,6 +494,30 @@ class GraphitiAdapter:
             logger.error(f"Failed to search entities: {e}")
             return []
 
+    async def count_entities_by_type(self, entity_types: List[str]) -> Dict[str, int]:
+        """Count entities per type with a single aggregation query"""
+        counts = {entity_type: 0 for entity_type in entity_types}
+        if not self.enabled or not entity_types:
+            return counts
+
+        try:
+            # The driver is synchronous, so run the query off the event loop
+            counts.update(await asyncio.to_thread(self._count_entities_by_type, entity_types))
+        except Exception as e:
+            logger.error(f"Failed to count entities: {e}")
+        return counts
+
+    def _count_entities_by_type(self, entity_types: List[str]) -> Dict[str, int]:
+        """Blocking half of count_entities_by_type"""
+        query_cypher = """
+        MATCH (e:Entity)
+        WHERE e.type IN $entity_types
+        RETURN e.type as type, count(*) as n
+        """
+        with self.driver.session(database=self.database) as session:
+            result = session.run(query_cypher, {"entity_types": entity_types})
+            return {record["type"]: record["n"] for record in result}
+
     async def get_related_entities(self, entity_name: str, relationship_types: Optional[List[str]] = None, max_depth: int = 2) -> List[Dict[str, Any]]:
         """Get entities related to a given entity"""
         if not self.enabled: